@@ -99,12 +99,13 @@ class StatlyDjangoMiddleware:
         request_info = self._extract_request_info(request)
 
         # Set tags
-        Statly.set_tag("http.method", request.method)
-        Statly.set_tag("http.url", request.path)
+        tags = {"http.method": request.method, "http.url": request.path}
 
         # Get resolver match for transaction name
         if hasattr(request, "resolver_match") and request.resolver_match:
-            Statly.set_tag("transaction", request.resolver_match.view_name)
+            tags["transaction"] = request.resolver_match.view_name
+
+        Statly.set_tags(tags)
 
         # Capture exception
         Statly.capture_exception(exception, context={"request": request_info})
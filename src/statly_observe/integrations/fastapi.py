@@ -116,8 +116,7 @@ class StatlyFastAPI:
         request_info = await self._extract_request_info(request)
 
         # Set tags
-        Statly.set_tag("http.method", request.method)
-        Statly.set_tag("http.url", request.url.path)
+        Statly.set_tags({"http.method": request.method, "http.url": request.url.path})
 
         # Capture exception
         Statly.capture_exception(exc, context={"request": request_info})
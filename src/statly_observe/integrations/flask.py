@@ -181,10 +181,10 @@ class StatlyFlask:
                     pass
 
             # Set tags
-            Statly.set_tag("http.method", request.method)
-            Statly.set_tag("http.url", request.path)
+            tags = {"http.method": request.method, "http.url": request.path}
             if request.endpoint:
-                Statly.set_tag("transaction", request.endpoint)
+                tags["transaction"] = request.endpoint
+            Statly.set_tags(tags)
 
             Statly.capture_exception(exception, context={"request": request_info})
 
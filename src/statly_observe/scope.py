@@ -4,6 +4,7 @@ Scope module for Statly Observe SDK.
 Manages contextual data that is attached to events.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 from contextvars import ContextVar
@@ -22,11 +23,15 @@ class Scope:
     tags: dict[str, str] = field(default_factory=dict)
     extra: dict[str, Any] = field(default_factory=dict)
     contexts: dict[str, Any] = field(default_factory=dict)
-    breadcrumbs: list[dict[str, Any]] = field(default_factory=list)
+    breadcrumbs: deque[dict[str, Any]] = field(default_factory=deque)
     max_breadcrumbs: int = 100
     transaction_name: str | None = None
     fingerprint: list[str] | None = None
 
+    def __post_init__(self) -> None:
+        # Bounded deque drops the oldest breadcrumb once the limit is reached
+        self.breadcrumbs = deque(self.breadcrumbs, maxlen=self.max_breadcrumbs)
+
     def set_user(
         self,
         id: str | None = None,
@@ -139,11 +144,11 @@ class Scope:
         if data is not None:
             crumb["data"] = data
 
-        self.breadcrumbs.append(crumb)
+        # Pick up changes to max_breadcrumbs made after construction
+        if self.breadcrumbs.maxlen != self.max_breadcrumbs:
+            self.breadcrumbs = deque(self.breadcrumbs, maxlen=self.max_breadcrumbs)
 
-        # Trim breadcrumbs if we exceed the limit
-        if len(self.breadcrumbs) > self.max_breadcrumbs:
-            self.breadcrumbs = self.breadcrumbs[-self.max_breadcrumbs :]
+        self.breadcrumbs.append(crumb)
 
     def clear_breadcrumbs(self) -> None:
         """Clear all breadcrumbs."""
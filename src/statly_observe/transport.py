@@ -9,8 +9,10 @@ import threading
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from queue import Queue, Empty
 from typing import Any
+from urllib.parse import urlparse
 import logging
 
 import requests
@@ -18,6 +20,28 @@ import requests
 logger = logging.getLogger("statly_observe")
 
 
+@lru_cache(maxsize=16)
+def _endpoint_from_dsn(dsn: str) -> str:
+    """
+    Build the ingest endpoint URL for a DSN.
+
+    DSNs are effectively constant per process, so the result is cached.
+
+    Args:
+        dsn: The Data Source Name (format: https://<api-key>@statly.live/<org-slug>)
+
+    Returns:
+        The API endpoint URL.
+    """
+    try:
+        parsed = urlparse(dsn)
+        # Construct the ingest endpoint on the same host
+        return f"{parsed.scheme}://{parsed.hostname}/api/v1/observe/ingest"
+    except Exception:
+        # Fallback to default endpoint
+        return "https://statly.live/api/v1/observe/ingest"
+
+
 class Transport(ABC):
     """Abstract base class for event transports."""
 
@@ -99,14 +123,7 @@ class HttpTransport(Transport):
         if not dsn:
             raise ValueError("DSN is required")
 
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(dsn)
-            # Construct the ingest endpoint on the same host
-            return f"{parsed.scheme}://{parsed.hostname}/api/v1/observe/ingest"
-        except Exception:
-            # Fallback to default endpoint
-            return "https://statly.live/api/v1/observe/ingest"
+        return _endpoint_from_dsn(dsn)
 
     def _start_worker(self) -> None:
         """Start the background worker thread."""
@@ -274,12 +291,7 @@ class SyncTransport(Transport):
 
     def _parse_dsn(self, dsn: str) -> str:
         """Parse DSN and return the endpoint URL."""
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(dsn)
-            return f"{parsed.scheme}://{parsed.hostname}/api/v1/observe/ingest"
-        except Exception:
-            return "https://statly.live/api/v1/observe/ingest"
+        return _endpoint_from_dsn(dsn)
 
     def send(self, event: dict[str, Any]) -> bool:
         """Send an event synchronously."""
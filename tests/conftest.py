@@ -0,0 +1,194 @@
+"""
+Shared fixtures for Statly Observe Python SDK tests.
+"""
+
+import inspect
+
+import pytest
+
+from statly_observe import StatlyClient
+from statly_observe.scope import Scope, set_current_scope
+from statly_observe.transport import HttpTransport, Transport, TransportOptions
+
+DSN = "https://sk_test_xxx@statly.live/test"
+
+
+class EventBuffer:
+    """Pre-sized event sink with a write cursor, doubling its storage when full."""
+
+    def __init__(self, capacity=64):
+        self._events = [None] * capacity
+        self._i = 0
+
+    def append(self, event):
+        if self._i == len(self._events):
+            self._events.extend([None] * max(len(self._events), 1))
+        self._events[self._i] = event
+        self._i += 1
+
+    def __len__(self):
+        return self._i
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._i
+        if not 0 <= index < self._i:
+            raise IndexError("event index out of range")
+        return self._events[index]
+
+
+class NullTransport(Transport):
+    """Transport that discards every event."""
+
+    def send(self, event):
+        return True
+
+    def flush(self, timeout=None):
+        pass
+
+    def close(self, timeout=None):
+        pass
+
+
+# Client options that tests may override, with their constructor defaults
+CLIENT_DEFAULTS = {
+    name: param.default
+    for name, param in inspect.signature(StatlyClient.__init__).parameters.items()
+    if name not in ("self", "dsn", "transport")
+}
+
+
+def _reset_client(client, overrides):
+    options = {**CLIENT_DEFAULTS, **overrides}
+    for key, value in options.items():
+        setattr(client, key, value)
+
+    # Drop any scope pushed through the context variable by a previous test
+    set_current_scope(None)
+    client.scope_manager.max_breadcrumbs = options["max_breadcrumbs"]
+    global_scope = client.scope_manager.get_global()
+    global_scope.clear()
+    global_scope.max_breadcrumbs = options["max_breadcrumbs"]
+    return client
+
+
+def pytest_configure(config):
+    # Benchmarks run once as plain tests unless --benchmark-enable is passed
+    if config.pluginmanager.hasplugin("benchmark") and not config.getoption(
+        "benchmark_enable"
+    ):
+        config.option.benchmark_disable = True
+
+
+# Optional dev plugins as (plugin name, fixture it provides, package to install)
+OPTIONAL_PLUGINS = [
+    ("benchmark", "benchmark", "pytest-benchmark"),
+    ("pytest_time", "instant_sleep", "pytest-time"),
+]
+
+
+def pytest_collection_modifyitems(config, items):
+    for plugin, fixture, package in OPTIONAL_PLUGINS:
+        if config.pluginmanager.hasplugin(plugin):
+            continue
+
+        skip = pytest.mark.skip(reason=f"{package} is not installed")
+        for item in items:
+            if fixture in getattr(item, "fixturenames", ()):
+                item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def raised_value_error():
+    """A ValueError raised once per session, with its traceback attached."""
+    try:
+        raise ValueError("Test error")
+    except ValueError as e:
+        return e
+
+
+@pytest.fixture(scope="session")
+def _mock_transport():
+    """Build a single mock transport per session."""
+    # Imported lazily so collecting the test modules does not load unittest.mock
+    from unittest.mock import Mock
+
+    return Mock(spec=Transport)
+
+
+@pytest.fixture
+def captured_events():
+    """Events sent through the mock transport during the current test."""
+    return EventBuffer()
+
+
+@pytest.fixture
+def transport(_mock_transport, captured_events):
+    """The shared mock transport, sending into this test's captured_events."""
+
+    def send(event):
+        captured_events.append(event)
+        return True
+
+    _mock_transport.send.side_effect = send
+    yield _mock_transport
+    _mock_transport.reset_mock()
+
+
+@pytest.fixture(scope="session")
+def dsn():
+    """The DSN used by the shared test client."""
+    return DSN
+
+
+@pytest.fixture(scope="session")
+def base_client(dsn):
+    """Build a single client per session."""
+    return StatlyClient(dsn=dsn, transport=NullTransport())
+
+
+@pytest.fixture
+def make_client(request, base_client, transport):
+    """
+    Return a freshly reset (client, transport) pair.
+
+    Parametrize indirectly with a dict of client attributes to override
+    the defaults for a single test.
+    """
+    client = _reset_client(base_client, getattr(request, "param", {}))
+    client.transport = transport
+    return client, transport
+
+
+@pytest.fixture
+def client(make_client):
+    """The shared client, reset for the current test."""
+    return make_client[0]
+
+
+@pytest.fixture
+def bench_client(base_client):
+    """The shared client, reset and sending to a NullTransport."""
+    client = _reset_client(base_client, {})
+    client.transport = NullTransport()
+    return client
+
+
+@pytest.fixture
+def http_transport(monkeypatch, dsn):
+    """An HttpTransport without its worker thread, so queued events stay pending."""
+    monkeypatch.setattr(HttpTransport, "_start_worker", lambda self: None)
+    return HttpTransport(TransportOptions(dsn=dsn))
+
+
+@pytest.fixture(scope="module")
+def _module_scope():
+    """Build a single scope per test module."""
+    return Scope()
+
+
+@pytest.fixture
+def scope(_module_scope):
+    """The shared scope, cleared for the current test."""
+    _module_scope.clear()
+    return _module_scope
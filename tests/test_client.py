@@ -2,215 +2,166 @@
 Tests for Statly Observe Python SDK client.
 """
 
+from collections import deque
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import Mock, patch
+import requests
 
 from statly_observe import Statly, StatlyClient
 from statly_observe.event import Event, EventLevel, extract_exception_info
 from statly_observe.scope import Scope
-from statly_observe.transport import Transport
-
-
-class MockTransport(Transport):
-    """Mock transport for testing."""
-
-    def __init__(self):
-        self.events = []
-        self.flushed = False
-        self.closed = False
 
-    def send(self, event):
-        self.events.append(event)
-        return True
+EXPECTED_TAGS = MappingProxyType({"key": "value", "foo": "bar", "baz": "qux"})
+USER_CTX = MappingProxyType({"id": "user-123", "email": "test@example.com"})
+BREADCRUMB = MappingProxyType(
+    {
+        "message": "Test breadcrumb",
+        "category": "test",
+        "level": "info",
+        "data": {"key": "value"},
+    }
+)
 
-    def flush(self, timeout=None):
-        self.flushed = True
 
-    def close(self, timeout=None):
-        self.closed = True
+def _add_custom_tag(event):
+    event.setdefault("tags", {})["custom"] = "added"
+    return event
 
 
 class TestStatlyClient:
     """Tests for StatlyClient."""
 
-    def test_init_creates_client(self):
+    pytestmark = pytest.mark.xdist_group(name="client_tests")
+
+    def test_init_creates_client(self, transport, dsn):
         """Test client initialization."""
-        transport = MockTransport()
         client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
+            dsn=dsn,
             environment="test",
             release="1.0.0",
             transport=transport,
         )
 
-        assert client.dsn == "https://sk_test_xxx@statly.live/test"
+        assert client.dsn == dsn
         assert client.environment == "test"
         assert client.release == "1.0.0"
+        assert client.transport is transport
 
-    def test_capture_exception(self):
+    def test_capture_exception(self, client, captured_events, raised_value_error):
         """Test capturing an exception."""
-        transport = MockTransport()
-        client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
-            transport=transport,
-        )
-
-        try:
-            raise ValueError("Test error")
-        except ValueError as e:
-            event_id = client.capture_exception(e)
+        event_id = client.capture_exception(raised_value_error)
 
         assert event_id != ""
-        assert len(transport.events) == 1
-        assert transport.events[0]["level"] == "error"
-        assert len(transport.events[0]["exception"]["values"]) == 1
+        assert len(captured_events) == 1
+        sent_event = captured_events[0]
+        assert sent_event["level"] == "error"
+        assert len(sent_event["exception"]["values"]) == 1
 
-    def test_capture_message(self):
+    def test_capture_message(self, client, captured_events):
         """Test capturing a message."""
-        transport = MockTransport()
-        client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
-            transport=transport,
-        )
-
         event_id = client.capture_message("Test message", level="warning")
 
         assert event_id != ""
-        assert len(transport.events) == 1
-        assert transport.events[0]["message"] == "Test message"
-        assert transport.events[0]["level"] == "warning"
-
-    def test_set_user(self):
-        """Test setting user context."""
-        transport = MockTransport()
-        client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
-            transport=transport,
-        )
-
-        client.set_user(id="user-123", email="test@example.com")
+        assert len(captured_events) == 1
+        sent_event = captured_events[0]
+        assert sent_event["message"] == "Test message"
+        assert sent_event["level"] == "warning"
+
+    @pytest.mark.parametrize(
+        "mutate,check",
+        [
+            (
+                lambda c: c.set_user(**USER_CTX),
+                lambda e: e["user"] == USER_CTX,
+            ),
+            (
+                lambda c: c.set_tags(EXPECTED_TAGS),
+                lambda e: EXPECTED_TAGS.items() <= e["tags"].items(),
+            ),
+            (
+                lambda c: c.add_breadcrumb(**BREADCRUMB),
+                lambda e: len(e["breadcrumbs"]["values"]) == 1
+                and BREADCRUMB.items() <= e["breadcrumbs"]["values"][0].items(),
+            ),
+            (
+                lambda c: setattr(c, "before_send", _add_custom_tag),
+                lambda e: e["tags"]["custom"] == "added",
+            ),
+        ],
+        ids=["set_user", "set_tags", "add_breadcrumb", "before_send_callback"],
+    )
+    def test_scope_mutation(self, client, captured_events, mutate, check):
+        """Test that client mutations are reflected in the sent event."""
+        mutate(client)
         client.capture_message("Test")
 
-        assert len(transport.events) == 1
-        assert transport.events[0]["user"]["id"] == "user-123"
-        assert transport.events[0]["user"]["email"] == "test@example.com"
-
-    def test_set_tags(self):
-        """Test setting tags."""
-        transport = MockTransport()
-        client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
-            transport=transport,
-        )
+        assert len(captured_events) == 1
+        assert check(captured_events[0])
 
+    def test_set_tag_single(self, client, captured_events):
+        """Test setting a single tag."""
         client.set_tag("key", "value")
-        client.set_tags({"foo": "bar", "baz": "qux"})
         client.capture_message("Test")
 
-        assert len(transport.events) == 1
-        assert transport.events[0]["tags"]["key"] == "value"
-        assert transport.events[0]["tags"]["foo"] == "bar"
-        assert transport.events[0]["tags"]["baz"] == "qux"
+        assert len(captured_events) == 1
+        assert captured_events[0]["tags"]["key"] == "value"
 
-    def test_add_breadcrumb(self):
-        """Test adding breadcrumbs."""
-        transport = MockTransport()
-        client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
-            transport=transport,
-        )
-
-        client.add_breadcrumb(
-            message="Test breadcrumb",
-            category="test",
-            level="info",
-            data={"key": "value"},
-        )
-        client.capture_message("Test")
-
-        assert len(transport.events) == 1
-        breadcrumbs = transport.events[0]["breadcrumbs"]["values"]
-        assert len(breadcrumbs) == 1
-        assert breadcrumbs[0]["message"] == "Test breadcrumb"
-        assert breadcrumbs[0]["category"] == "test"
-
-    def test_sample_rate(self):
+    @pytest.mark.parametrize(
+        "make_client",
+        [{"sample_rate": 0.0}],  # Drop all events
+        indirect=True,
+    )
+    def test_sample_rate(self, client, captured_events):
         """Test sample rate filtering."""
-        transport = MockTransport()
-        client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
-            sample_rate=0.0,  # Drop all events
-            transport=transport,
-        )
-
         client.capture_message("Test")
 
-        assert len(transport.events) == 0
-
-    def test_before_send_callback(self):
-        """Test before_send callback."""
-        transport = MockTransport()
-
-        def before_send(event):
-            event["tags"]["custom"] = "added"
-            return event
-
-        client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
-            before_send=before_send,
-            transport=transport,
-        )
+        assert len(captured_events) == 0
 
+    @pytest.mark.parametrize(
+        "make_client",
+        [{"before_send": lambda event: None}],  # Drop all events
+        indirect=True,
+    )
+    def test_before_send_drop_event(self, client, captured_events):
+        """Test dropping events with before_send."""
         client.capture_message("Test")
 
-        assert len(transport.events) == 1
-        assert transport.events[0]["tags"]["custom"] == "added"
-
-    def test_before_send_drop_event(self):
-        """Test dropping events with before_send."""
-        transport = MockTransport()
+        assert len(captured_events) == 0
 
-        def before_send(event):
-            return None  # Drop all events
+    @pytest.mark.stress
+    def test_throughput(self, client, captured_events):
+        """Test capturing many messages in a row."""
+        for i in range(10_000):
+            client.capture_message(f"Message {i}")
 
-        client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
-            before_send=before_send,
-            transport=transport,
-        )
+        assert len(captured_events) == 10_000
+        assert captured_events[-1]["message"] == "Message 9999"
 
-        client.capture_message("Test")
+    def test_bench_capture_message(self, benchmark, bench_client):
+        """Benchmark the capture_message hot path."""
+        event_id = benchmark(bench_client.capture_message, "x")
 
-        assert len(transport.events) == 0
+        assert event_id != ""
 
-    def test_flush(self):
+    def test_flush(self, client, transport):
         """Test flushing events."""
-        transport = MockTransport()
-        client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
-            transport=transport,
-        )
-
         client.flush()
 
-        assert transport.flushed
+        transport.flush.assert_called_once()
 
-    def test_close(self):
+    def test_close(self, client, transport):
         """Test closing client."""
-        transport = MockTransport()
-        client = StatlyClient(
-            dsn="https://sk_test_xxx@statly.live/test",
-            transport=transport,
-        )
-
         client.close()
 
-        assert transport.closed
+        transport.close.assert_called_once()
 
 
 class TestEvent:
     """Tests for Event class."""
 
+    pytestmark = pytest.mark.xdist_group(name="event_tests")
+
     def test_event_creation(self):
         """Test event creation."""
         event = Event(
@@ -239,16 +190,26 @@ class TestEvent:
         assert data["message"] == "Test warning"
         assert data["tags"]["key"] == "value"
 
+    def test_event_to_dict_independent(self):
+        """Test repeated serialization returns independent dicts."""
+        event = Event(level=EventLevel.WARNING, message="Test warning")
+
+        first = event.to_dict()
+        first["level"] = "HACKED"  # e.g. a before_send callback rewriting the payload
+        second = event.to_dict()
+
+        assert second is not first
+        assert second["level"] == "warning"
+
 
 class TestExceptionExtraction:
     """Tests for exception extraction."""
 
-    def test_extract_exception_info(self):
+    pytestmark = pytest.mark.xdist_group(name="exception_tests")
+
+    def test_extract_exception_info(self, raised_value_error):
         """Test extracting exception information."""
-        try:
-            raise ValueError("Test error")
-        except ValueError as e:
-            info = extract_exception_info(e)
+        info = extract_exception_info(raised_value_error)
 
         assert info.type == "ValueError"
         assert info.value == "Test error"
@@ -273,39 +234,35 @@ class TestExceptionExtraction:
 class TestScope:
     """Tests for Scope class."""
 
+    pytestmark = pytest.mark.xdist_group(name="scope_tests")
+
     def test_scope_creation(self):
         """Test scope creation."""
         scope = Scope()
 
         assert scope.user is None
         assert scope.tags == {}
-        assert scope.breadcrumbs == []
+        assert len(scope.breadcrumbs) == 0
 
-    def test_scope_set_user(self):
+    def test_scope_set_user(self, scope):
         """Test setting user on scope."""
-        scope = Scope()
         scope.set_user(id="123", email="test@example.com")
 
-        assert scope.user["id"] == "123"
-        assert scope.user["email"] == "test@example.com"
+        assert scope.user == {"id": "123", "email": "test@example.com"}
 
-    def test_scope_set_tags(self):
+    def test_scope_set_tags(self, scope):
         """Test setting tags on scope."""
-        scope = Scope()
         scope.set_tag("key", "value")
         scope.set_tags({"foo": "bar"})
 
-        assert scope.tags["key"] == "value"
-        assert scope.tags["foo"] == "bar"
+        assert scope.tags == {"key": "value", "foo": "bar"}
 
-    def test_scope_add_breadcrumb(self):
+    def test_scope_add_breadcrumb(self, scope):
         """Test adding breadcrumbs to scope."""
-        scope = Scope()
         scope.add_breadcrumb(message="Test", category="test")
 
         assert len(scope.breadcrumbs) == 1
-        assert scope.breadcrumbs[0]["message"] == "Test"
-        assert scope.breadcrumbs[0]["category"] == "test"
+        assert {"message": "Test", "category": "test"}.items() <= scope.breadcrumbs[0].items()
 
     def test_scope_max_breadcrumbs(self):
         """Test breadcrumb limit."""
@@ -314,12 +271,46 @@ class TestScope:
         for i in range(10):
             scope.add_breadcrumb(message=f"Breadcrumb {i}")
 
+        assert isinstance(scope.breadcrumbs, deque)
         assert len(scope.breadcrumbs) == 5
         assert scope.breadcrumbs[0]["message"] == "Breadcrumb 5"
 
-    def test_scope_clone(self):
+    def test_scope_max_breadcrumbs_changed(self):
+        """Test changing the breadcrumb limit after construction."""
+        scope = Scope(max_breadcrumbs=5)
+        scope.max_breadcrumbs = 2
+
+        for i in range(10):
+            scope.add_breadcrumb(message=f"Breadcrumb {i}")
+
+        assert len(scope.breadcrumbs) == 2
+        assert scope.breadcrumbs[0]["message"] == "Breadcrumb 8"
+
+    @pytest.mark.stress
+    def test_scope_max_breadcrumbs_many(self):
+        """Test breadcrumb limit under sustained overflow."""
+        scope = Scope(max_breadcrumbs=5)
+
+        for i in range(10_000):
+            scope.add_breadcrumb(message=f"Breadcrumb {i}")
+
+        assert len(scope.breadcrumbs) == 5
+        assert scope.breadcrumbs[0]["message"] == "Breadcrumb 9995"
+        assert scope.breadcrumbs[-1]["message"] == "Breadcrumb 9999"
+
+    def test_scope_breadcrumbs_serialized_as_list(self, scope):
+        """Test breadcrumbs reach the event payload as a plain list."""
+        scope.add_breadcrumb(message="Test", category="test")
+
+        event = scope.apply_to_event(Event(message="Test"))
+        values = event.to_dict()["breadcrumbs"]["values"]
+
+        assert type(event.breadcrumbs) is list
+        assert type(values) is list
+        assert [crumb["message"] for crumb in values] == ["Test"]
+
+    def test_scope_clone(self, scope):
         """Test scope cloning."""
-        scope = Scope()
         scope.set_user(id="123")
         scope.set_tag("key", "value")
 
@@ -329,9 +320,8 @@ class TestScope:
         assert cloned.tags["key"] == "value"
         assert cloned is not scope
 
-    def test_scope_clear(self):
+    def test_scope_clear(self, scope):
         """Test clearing scope."""
-        scope = Scope()
         scope.set_user(id="123")
         scope.set_tag("key", "value")
         scope.add_breadcrumb(message="Test")
@@ -340,4 +330,37 @@ class TestScope:
 
         assert scope.user is None
         assert scope.tags == {}
-        assert scope.breadcrumbs == []
+        assert len(scope.breadcrumbs) == 0
+
+
+class TestHttpTransport:
+    """Tests for HttpTransport timeouts and retries."""
+
+    pytestmark = pytest.mark.xdist_group(name="transport_tests")
+
+    def test_flush_timeout(self, http_transport, instant_sleep):
+        """Test flush gives up after its timeout when events stay pending."""
+        http_transport.send({"event_id": "abc"})
+
+        http_transport.flush(timeout=10.0)
+
+        assert http_transport._pending_count == 1
+        assert instant_sleep.offset_ns >= 10_000_000_000
+
+    def test_send_batch_retry_backoff(self, http_transport, instant_sleep, monkeypatch):
+        """Test failed batches are retried with exponential backoff."""
+
+        def post(*args, **kwargs):
+            raise requests.ConnectionError("unreachable")
+
+        monkeypatch.setattr(requests, "post", post)
+
+        assert not http_transport._send_batch([{"event_id": "abc"}])
+        # retry_delay * (1 + 2 + 4) for the default three attempts
+        assert instant_sleep.offset_ns == 7_000_000_000
+
+    def test_close(self, http_transport, instant_sleep):
+        """Test closing the transport rejects further events."""
+        http_transport.close(timeout=5.0)
+
+        assert not http_transport.send({"event_id": "abc"})